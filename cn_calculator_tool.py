@@ -19,9 +19,8 @@ from qgis.PyQt.QtCore import Qt, pyqtSignal
 from qgis.core import (
     QgsCoordinateReferenceSystem, QgsProcessingFeedback, QgsProject,
     QgsVectorFileWriter, QgsVectorLayer, QgsField, QgsFeature,
-    QgsWkbTypes, Qgis, QgsMessageLog
+    QgsWkbTypes, Qgis, QgsMessageLog, QgsFeatureRequest
 )
-from qgis import processing
 
 # Import our shared components
 from hydro_suite_interface import HydroToolInterface, LayerSelectionMixin
@@ -45,6 +44,7 @@ class CNCalculatorTool(HydroToolInterface, LayerSelectionMixin):
         # Tool-specific properties
         self.target_crs = QgsCoordinateReferenceSystem("EPSG:3361")
         self.lookup_data = {}
+        self.lookup_source = None  # Key of the table currently in lookup_data
         
         # GUI components
         self.subbasin_selector = None
@@ -254,6 +254,13 @@ class CNCalculatorTool(HydroToolInterface, LayerSelectionMixin):
         if not lookup_file:
             raise ValueError("No lookup file selected")
             
+        # Skip re-reading a table that has not changed since the last load
+        source_key = None
+        if os.path.exists(lookup_file):
+            source_key = (lookup_file, os.path.getmtime(lookup_file))
+        if self.lookup_data and source_key is not None and source_key == self.lookup_source:
+            return
+            
         # Import pandas for reading the lookup table
         try:
             import pandas as pd
@@ -291,6 +298,7 @@ class CNCalculatorTool(HydroToolInterface, LayerSelectionMixin):
         if not self.lookup_data:
             raise ValueError("No valid CN values found in lookup table")
             
+        self.lookup_source = source_key
         self.progress_logger.log(f"Loaded {len(self.lookup_data)} CN lookup entries from {Path(lookup_file).name}")
         
     def validate_inputs(self) -> Tuple[bool, str]:
@@ -357,6 +365,11 @@ class CNCalculatorTool(HydroToolInterface, LayerSelectionMixin):
             
             progress_callback(10, "Validating layer geometry and CRS...")
             
+            # Stop before any reprojection or overlay work if an input is empty
+            for layer in (subbasin_layer, landuse_layer, soils_layer):
+                if layer.featureCount() == 0:
+                    raise ValueError(f"Layer {layer.name()} has no features")
+                    
             # Create feedback object for QGIS processing
             feedback = QgsProcessingFeedback()
             
@@ -405,6 +418,8 @@ class CNCalculatorTool(HydroToolInterface, LayerSelectionMixin):
         if layer.crs() == self.target_crs:
             return layer
             
+        from qgis import processing
+        
         self.progress_logger.log(f"Reprojecting {layer.name()} from {layer.crs().authid()} to {self.target_crs.authid()}")
         
         params = {
@@ -417,6 +432,8 @@ class CNCalculatorTool(HydroToolInterface, LayerSelectionMixin):
         
     def intersect_layers(self, layer1: QgsVectorLayer, layer2: QgsVectorLayer, feedback) -> QgsVectorLayer:
         """Perform intersection between two layers"""
+        from qgis import processing
+        
         self.progress_logger.log(f"Intersecting {layer1.name()} with {layer2.name()}")
         
         params = {
@@ -440,14 +457,31 @@ class CNCalculatorTool(HydroToolInterface, LayerSelectionMixin):
         subbasin_data = {}
         detailed_records = []
         
-        for feature in intersection_layer.getFeatures():
+        # Resolve attribute indices once for the whole loop
+        subbasin_idx = self.get_field_index(intersection_layer, subbasin_field)
+        landuse_idx = self.get_field_index(intersection_layer, landuse_field)
+        soils_idx = self.get_field_index(intersection_layer, soils_field)
+        
+        # Only the three keyed attributes (plus geometry) are needed
+        request = QgsFeatureRequest().setSubsetOfAttributes(
+            [subbasin_idx, landuse_idx, soils_idx]
+        )
+        
+        # Parse each distinct soil value once and report each missing
+        # lookup once, rather than logging for every intersected feature
+        parsed_soil_groups = {}
+        missing_keys = set()
+        
+        for feature in intersection_layer.getFeatures(request):
             # Get attributes
-            subbasin_id = feature[subbasin_field]
-            landuse_code = str(feature[landuse_field]).strip().lower()
-            soil_group_raw = str(feature[soils_field]).strip()
+            subbasin_id = feature[subbasin_idx]
+            landuse_code = str(feature[landuse_idx]).strip().lower()
+            soil_group_raw = str(feature[soils_idx]).strip()
             
             # Parse soil group (handle split HSGs)
-            soil_group = self.parse_soil_group(soil_group_raw)
+            if soil_group_raw not in parsed_soil_groups:
+                parsed_soil_groups[soil_group_raw] = self.parse_soil_group(soil_group_raw)
+            soil_group = parsed_soil_groups[soil_group_raw]
             
             # Calculate area in acres
             area_sqft = feature.geometry().area()
@@ -456,10 +490,12 @@ class CNCalculatorTool(HydroToolInterface, LayerSelectionMixin):
             # Look up CN value
             cn_key = (landuse_code, soil_group)
             if cn_key not in self.lookup_data:
-                self.progress_logger.log(
-                    f"Warning: No CN found for land use '{landuse_code}' and soil group '{soil_group}'", 
-                    "warning"
-                )
+                if cn_key not in missing_keys:
+                    missing_keys.add(cn_key)
+                    self.progress_logger.log(
+                        f"Warning: No CN found for land use '{landuse_code}' and soil group '{soil_group}'", 
+                        "warning"
+                    )
                 continue
                 
             cn_value = self.lookup_data[cn_key]
@@ -532,9 +568,10 @@ class CNCalculatorTool(HydroToolInterface, LayerSelectionMixin):
         # Add features with calculated CN values
         output_features = []
         subbasin_data = results['subbasin_data']
+        subbasin_idx = self.get_field_index(subbasin_layer, subbasin_field)
         
         for orig_feature in subbasin_layer.getFeatures():
-            subbasin_id = orig_feature[subbasin_field]
+            subbasin_id = orig_feature[subbasin_idx]
             
             new_feature = QgsFeature()
             new_feature.setGeometry(orig_feature.geometry())
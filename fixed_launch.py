@@ -1,19 +1,45 @@
 """
 Fixed launcher that properly handles QGIS Python console imports
+
+Run from the QGIS Python console with exec(open(r'.../fixed_launch.py').read()).
+Importing the module only defines load_hydro_suite(); call it to launch.
 """
 
 import sys
 import os
 import importlib.util
 
+# Console text written in one call each instead of a print() per line
+_BANNER = "🔧 Fixed Hydro Suite Launcher\n" + "=" * 50 + "\n"
+_USAGE_TEXT = "\n".join([
+    "✅ Hydro Suite launched successfully!",
+    "",
+    "📋 Usage Instructions:",
+    "1. Select a tool from the left panel",
+    "2. Configure your input layers and fields",
+    "3. Watch the validation panel for ✅ status",
+    "4. Click 'Run' when all inputs are valid",
+    "",
+])
+
+# Modules in dependency order; each one only imports modules listed above it.
+# Loading stays sequential: every module imports its predecessors at top level,
+# so executing them concurrently would race on sys.modules.
+_MODULE_LOAD_ORDER = (
+    'shared_widgets',
+    'hydro_suite_interface',
+    'cn_calculator_tool',
+    'rational_c_tool',
+    'tc_calculator_tool',
+    'channel_designer_tool',
+    'hydro_suite_main',
+)
+
 def load_hydro_suite():
-    print("🔧 Fixed Hydro Suite Launcher")
-    print("=" * 50)
-    
     # Define the directory
     script_dir = r'E:\CLAUDE_Workspace\Claude\Report_Files\Codebase\Hydro_Suite\Hydro_Suite_Data'
     
-    print(f"Loading from: {script_dir}")
+    sys.stdout.write(f"{_BANNER}Loading from: {script_dir}\n")
     
     # Method 1: Add to sys.path and refresh
     if script_dir not in sys.path:
@@ -31,55 +57,22 @@ def load_hydro_suite():
         return module
     
     try:
-        # Load modules in dependency order
-        print("Loading shared_widgets...")
-        shared_widgets = load_module_from_file(
-            'shared_widgets', 
-            os.path.join(script_dir, 'shared_widgets.py')
-        )
-        print("✅ shared_widgets loaded")
-        
-        print("Loading hydro_suite_interface...")
-        hydro_suite_interface = load_module_from_file(
-            'hydro_suite_interface',
-            os.path.join(script_dir, 'hydro_suite_interface.py')
-        )
-        print("✅ hydro_suite_interface loaded")
+        # Check every module file up front with a single directory scan
+        with os.scandir(script_dir) as entries:
+            present = {entry.name for entry in entries if entry.is_file()}
+        missing = [name for name in _MODULE_LOAD_ORDER if f'{name}.py' not in present]
+        if missing:
+            raise ImportError(f"Missing module files in {script_dir}: {', '.join(missing)}")
         
-        print("Loading cn_calculator_tool...")
-        cn_calculator_tool = load_module_from_file(
-            'cn_calculator_tool',
-            os.path.join(script_dir, 'cn_calculator_tool.py')
-        )
-        print("✅ cn_calculator_tool loaded")
-        
-        print("Loading rational_c_tool...")
-        rational_c_tool = load_module_from_file(
-            'rational_c_tool',
-            os.path.join(script_dir, 'rational_c_tool.py')
-        )
-        print("✅ rational_c_tool loaded")
-        
-        print("Loading tc_calculator_tool...")
-        tc_calculator_tool = load_module_from_file(
-            'tc_calculator_tool',
-            os.path.join(script_dir, 'tc_calculator_tool.py')
-        )
-        print("✅ tc_calculator_tool loaded")
-        
-        print("Loading channel_designer_tool...")
-        channel_designer_tool = load_module_from_file(
-            'channel_designer_tool',
-            os.path.join(script_dir, 'channel_designer_tool.py')
-        )
-        print("✅ channel_designer_tool loaded")
-        
-        print("Loading hydro_suite_main...")
-        hydro_suite_main = load_module_from_file(
-            'hydro_suite_main',
-            os.path.join(script_dir, 'hydro_suite_main.py')
-        )
-        print("✅ hydro_suite_main loaded")
+        # Load modules in dependency order
+        modules = {}
+        for module_name in _MODULE_LOAD_ORDER:
+            print(f"Loading {module_name}...")
+            modules[module_name] = load_module_from_file(
+                module_name,
+                os.path.join(script_dir, f'{module_name}.py')
+            )
+            print(f"✅ {module_name} loaded")
         
         # Now launch the application
         print("\n🚀 Launching Hydro Suite...")
@@ -94,25 +87,24 @@ def load_hydro_suite():
             pass
         
         # Get the main window class
-        HydroSuiteMainWindow = hydro_suite_main.HydroSuiteMainWindow
+        HydroSuiteMainWindow = modules['hydro_suite_main'].HydroSuiteMainWindow
         
         hydro_suite_window = HydroSuiteMainWindow()
         hydro_suite_window.show()
         
-        print("✅ Hydro Suite launched successfully!")
-        print("\n📋 Usage Instructions:")
-        print("1. Select a tool from the left panel")
-        print("2. Configure your input layers and fields")
-        print("3. Watch the validation panel for ✅ status")
-        print("4. Click 'Run' when all inputs are valid")
+        sys.stdout.write(_USAGE_TEXT)
+        sys.stdout.flush()
         
         return hydro_suite_window
         
     except Exception as e:
         print(f"❌ Error: {e}")
         import traceback
-        print(f"Traceback:\n{traceback.format_exc()}")
+        print("Traceback:")
+        traceback.print_exc(file=sys.stdout)
         return None
 
-# Launch the application
-load_hydro_suite()
\ No newline at end of file
+# Launch the application when executed as a script or from the QGIS console
+# (the console's interpreter namespace is named "__console__")
+if __name__ in ("__main__", "__console__"):
+    load_hydro_suite()
\ No newline at end of file
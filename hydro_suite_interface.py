@@ -4,15 +4,30 @@ Defines the contract for all tools in the Hydro Suite
 Version 1.0 - 2025
 """
 
+import time
 from abc import ABC, abstractmethod
+from string import Template
 from typing import Optional, Tuple, Callable, Any, Dict
-from qgis.PyQt.QtWidgets import QWidget
+from qgis.PyQt.QtWidgets import QWidget, QVBoxLayout, QLabel, QPushButton, QMessageBox
 from qgis.core import QgsVectorLayer, QgsProject
 
 
+def _no_progress(progress: int, message: str) -> None:
+    """Progress callback used when the caller does not supply one"""
+
+
 class HydroToolInterface(ABC):
     """Base interface for all Hydro Suite tools"""
     
+    # Placeholders are parsed once, when the class body runs
+    _HELP_TEMPLATE = Template("""
+        <h2>$name</h2>
+        <p><b>Version:</b> $version</p>
+        <p><b>Author:</b> $author</p>
+        <p><b>Description:</b> $description</p>
+        <p>No additional help available.</p>
+        """)
+    
     def __init__(self):
         """Initialize the tool interface"""
         self.name = "Unnamed Tool"
@@ -27,6 +42,7 @@ class HydroToolInterface(ABC):
         self.is_running = False
         self.current_progress = 0
         self.gui_widget = None
+        self._help_cache = None  # Rendered by get_help_content on first use
         
     @abstractmethod
     def create_gui(self, parent_widget: QWidget) -> QWidget:
@@ -72,13 +88,13 @@ class HydroToolInterface(ABC):
         Returns:
             str: HTML-formatted help content
         """
-        return f"""
-        <h2>{self.name}</h2>
-        <p><b>Version:</b> {self.version}</p>
-        <p><b>Author:</b> {self.author}</p>
-        <p><b>Description:</b> {self.description}</p>
-        <p>No additional help available.</p>
-        """
+        # Metadata is set once in __init__, so render on first request and reuse
+        if self._help_cache is None:
+            self._help_cache = self._HELP_TEMPLATE.substitute(
+                name=self.name, version=self.version,
+                author=self.author, description=self.description
+            )
+        return self._help_cache
     
     def get_settings(self) -> Dict[str, Any]:
         """
@@ -105,18 +121,18 @@ class HydroToolInterface(ABC):
         pass
     
     def update_progress(self, value: int, message: str = "", 
-                       callback: Optional[Callable] = None) -> None:
+                       callback: Optional[Callable[[int, str], None]] = None) -> None:
         """
         Helper method to update progress
         
         Args:
             value: Progress value (0-100)
             message: Optional status message
-            callback: Progress callback function
+            callback: Optional progress callback function; None is ignored
         """
+        callback = callback or _no_progress
         self.current_progress = value
-        if callback:
-            callback(value, message)
+        callback(value, message)
 
 
 class LayerSelectionMixin:
@@ -165,12 +181,41 @@ class LayerSelectionMixin:
         Returns:
             bool: True if field exists
         """
-        return field_name in [field.name() for field in layer.fields()]
+        return layer.fields().indexOf(field_name) != -1
+    
+    @staticmethod
+    def get_field_index(layer: QgsVectorLayer, field_name: str) -> int:
+        """
+        Resolve a field name to its attribute index
+        
+        Resolve once before a feature loop and read attributes by index
+        instead of by name for every feature.
+        
+        Args:
+            layer: Vector layer
+            field_name: Field name to resolve
+            
+        Returns:
+            int: Attribute index of the field
+            
+        Raises:
+            ValueError: If the field does not exist
+        """
+        index = layer.fields().lookupField(field_name)
+        if index < 0:
+            raise ValueError(f"Field '{field_name}' not found in layer {layer.name()}")
+        return index
 
 
 class ProgressReporter:
     """Helper class for progress reporting"""
     
+    __slots__ = ('callback', 'total_steps', 'current_step',
+                 '_last_emitted_progress', '_last_emit_time')
+    
+    # Minimum seconds between intermediate callbacks (about 30 updates/s)
+    MIN_EMIT_INTERVAL = 0.033
+    
     def __init__(self, callback: Optional[Callable] = None, 
                  total_steps: int = 100):
         """
@@ -180,9 +225,12 @@ class ProgressReporter:
             callback: Progress callback function
             total_steps: Total number of steps
         """
-        self.callback = callback
+        # A no-op stand-in keeps update() free of a None check per tick
+        self.callback = callback if callback is not None else _no_progress
         self.total_steps = total_steps
         self.current_step = 0
+        self._last_emitted_progress = None
+        self._last_emit_time = 0.0
         
     def start(self, message: str = "Starting..."):
         """Start progress reporting"""
@@ -192,13 +240,23 @@ class ProgressReporter:
     def step(self, message: str = ""):
         """Increment progress by one step"""
         self.current_step += 1
-        progress = int((self.current_step / self.total_steps) * 100)
+        progress = min(self.current_step, self.total_steps) * 100 // self.total_steps
         self.update(progress, message)
     
     def update(self, progress: int, message: str = ""):
-        """Update progress"""
-        if self.callback:
-            self.callback(progress, message)
+        """Update progress, coalescing rapid silent percent changes"""
+        now = time.monotonic()
+        # Updates carrying a message (phase, error text) are always delivered;
+        # only bare percent changes are throttled, and 0/100 never are
+        if not message:
+            if progress == self._last_emitted_progress:
+                return
+            if (progress != 0 and progress != 100
+                    and now - self._last_emit_time < self.MIN_EMIT_INTERVAL):
+                return
+        self._last_emitted_progress = progress
+        self._last_emit_time = now
+        self.callback(progress, message)
     
     def finish(self, message: str = "Complete"):
         """Finish progress reporting"""
@@ -219,8 +277,6 @@ class ToolTemplate(HydroToolInterface, LayerSelectionMixin):
         
     def create_gui(self, parent_widget: QWidget) -> QWidget:
         """Create the tool GUI"""
-        from qgis.PyQt.QtWidgets import QVBoxLayout, QLabel, QPushButton
-        
         widget = QWidget(parent_widget)
         layout = QVBoxLayout(widget)
         
@@ -232,7 +288,7 @@ class ToolTemplate(HydroToolInterface, LayerSelectionMixin):
         
         # Run button
         run_btn = QPushButton("Run Tool")
-        run_btn.clicked.connect(lambda: self.run())
+        run_btn.clicked.connect(self._on_run_clicked)
         layout.addWidget(run_btn)
         
         layout.addStretch()
@@ -240,6 +296,10 @@ class ToolTemplate(HydroToolInterface, LayerSelectionMixin):
         self.gui_widget = widget
         return widget
     
+    def _on_run_clicked(self, checked: bool = False):
+        """Run the tool from the button; swallows the clicked(bool) argument"""
+        self.run()
+    
     def validate_inputs(self) -> Tuple[bool, str]:
         """Validate inputs"""
         # Add validation logic here
@@ -270,9 +330,87 @@ class ToolTemplate(HydroToolInterface, LayerSelectionMixin):
 
 
 # Wrapper adapters for existing tools
+def _build_launcher_widget(parent_widget: QWidget, description_html: str,
+                           button_text: str, button_qss: str,
+                           on_click: Callable) -> QWidget:
+    """
+    Build the description-plus-launch-button panel shared by the adapters
+    
+    Args:
+        parent_widget: Parent widget to attach the panel to
+        description_html: Rich text shown above the button
+        button_text: Launch button label
+        button_qss: Launch button stylesheet
+        on_click: Slot connected to the launch button
+        
+    Returns:
+        QWidget: The launcher panel
+    """
+    widget = QWidget(parent_widget)
+    layout = QVBoxLayout(widget)
+    
+    # Description
+    desc = QLabel(description_html)
+    desc.setWordWrap(True)
+    layout.addWidget(desc)
+    
+    # Launch button
+    launch_btn = QPushButton(button_text)
+    launch_btn.setStyleSheet(button_qss)
+    launch_btn.clicked.connect(on_click)
+    layout.addWidget(launch_btn)
+    
+    layout.addStretch()
+    return widget
+
+
+def _launch_placeholder_dialog(parent_widget: QWidget, title: str, body: str,
+                               tool_label: str) -> None:
+    """
+    Show the placeholder message used until an adapter launches its real dialog
+    
+    Args:
+        parent_widget: Parent widget for the message box
+        title: Message box title
+        body: Message text
+        tool_label: Tool name used in the error message
+    """
+    try:
+        QMessageBox.information(parent_widget, title, body)
+    except Exception as e:
+        QMessageBox.critical(parent_widget, "Error", f"Failed to launch {tool_label}: {str(e)}")
+
+
 class CNCalculatorAdapter(HydroToolInterface, LayerSelectionMixin):
     """Adapter for the Curve Number Calculator"""
     
+    _DESCRIPTION_HTML = (
+        "<h2>Curve Number Calculator</h2>"
+        "<p>This tool calculates area-weighted composite curve numbers "
+        "for hydrological modeling applications.</p>"
+        "<p><b>Features:</b></p>"
+        "<ul>"
+        "<li>Multi-layer intersection analysis</li>"
+        "<li>Split HSG handling (A/D, B/D, C/D)</li>"
+        "<li>Flexible lookup table support</li>"
+        "<li>SWMM/HEC-HMS compatible outputs</li>"
+        "</ul>"
+    )
+    
+    _LAUNCH_BUTTON_QSS = """
+        QPushButton {
+            font-size: 16px;
+            font-weight: bold;
+            padding: 15px;
+            background-color: #007bff;
+            color: white;
+            border-radius: 5px;
+        }
+        QPushButton:hover {
+            background-color: #0056b3;
+        }
+    """
+    
     def __init__(self):
         super().__init__()
         self.name = "Curve Number Calculator"
@@ -284,66 +422,24 @@ class CNCalculatorAdapter(HydroToolInterface, LayerSelectionMixin):
         
     def create_gui(self, parent_widget: QWidget) -> QWidget:
         """Create GUI by wrapping the existing dialog"""
-        from qgis.PyQt.QtWidgets import QVBoxLayout, QPushButton, QLabel
-        
-        widget = QWidget(parent_widget)
-        layout = QVBoxLayout(widget)
-        
-        # Description
-        desc = QLabel(
-            "<h2>Curve Number Calculator</h2>"
-            "<p>This tool calculates area-weighted composite curve numbers "
-            "for hydrological modeling applications.</p>"
-            "<p><b>Features:</b></p>"
-            "<ul>"
-            "<li>Multi-layer intersection analysis</li>"
-            "<li>Split HSG handling (A/D, B/D, C/D)</li>"
-            "<li>Flexible lookup table support</li>"
-            "<li>SWMM/HEC-HMS compatible outputs</li>"
-            "</ul>"
+        self.gui_widget = _build_launcher_widget(
+            parent_widget, self._DESCRIPTION_HTML, "Open CN Calculator",
+            self._LAUNCH_BUTTON_QSS, self.launch_original_dialog
         )
-        desc.setWordWrap(True)
-        layout.addWidget(desc)
-        
-        # Launch button
-        launch_btn = QPushButton("Open CN Calculator")
-        launch_btn.setStyleSheet("""
-            QPushButton {
-                font-size: 16px;
-                font-weight: bold;
-                padding: 15px;
-                background-color: #007bff;
-                color: white;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #0056b3;
-            }
-        """)
-        launch_btn.clicked.connect(self.launch_original_dialog)
-        layout.addWidget(launch_btn)
-        
-        layout.addStretch()
-        
-        self.gui_widget = widget
-        return widget
+        return self.gui_widget
     
     def launch_original_dialog(self):
         """Launch the original CN calculator dialog"""
-        try:
-            # This would import and launch the actual CN calculator
-            # For now, we'll show a placeholder message
-            from qgis.PyQt.QtWidgets import QMessageBox
-            QMessageBox.information(
-                self.gui_widget,
-                "CN Calculator",
-                "In production, this would launch the actual CN Calculator dialog.\n\n"
-                "The tool would be imported from:\n"
-                "Components/CN/composite_cn_calculator.py"
-            )
-        except Exception as e:
-            from qgis.PyQt.QtWidgets import QMessageBox
-            QMessageBox.critical(self.gui_widget, "Error", f"Failed to launch CN Calculator: {str(e)}")
+        # This would import and launch the actual CN calculator
+        # For now, we'll show a placeholder message
+        _launch_placeholder_dialog(
+            self.gui_widget,
+            "CN Calculator",
+            "In production, this would launch the actual CN Calculator dialog.\n\n"
+            "The tool would be imported from:\n"
+            "Components/CN/composite_cn_calculator.py",
+            "CN Calculator"
+        )
     
     def validate_inputs(self) -> Tuple[bool, str]:
         """Validation is handled by the original dialog"""
@@ -358,6 +454,33 @@ class CNCalculatorAdapter(HydroToolInterface, LayerSelectionMixin):
 class RationalCAdapter(HydroToolInterface, LayerSelectionMixin):
     """Adapter for the Rational C Calculator"""
     
+    _DESCRIPTION_HTML = (
+        "<h2>Rational Method C Calculator</h2>"
+        "<p>This tool calculates area-weighted composite runoff coefficients "
+        "for rational method analysis.</p>"
+        "<p><b>Features:</b></p>"
+        "<ul>"
+        "<li>Slope-based C value determination</li>"
+        "<li>Project-wide slope category selection</li>"
+        "<li>Handles unrecognized soil groups</li>"
+        "<li>Professional reporting formats</li>"
+        "</ul>"
+    )
+    
+    _LAUNCH_BUTTON_QSS = """
+        QPushButton {
+            font-size: 16px;
+            font-weight: bold;
+            padding: 15px;
+            background-color: #28a745;
+            color: white;
+            border-radius: 5px;
+        }
+        QPushButton:hover {
+            background-color: #218838;
+        }
+    """
+    
     def __init__(self):
         super().__init__()
         self.name = "Rational C Calculator"
@@ -368,64 +491,22 @@ class RationalCAdapter(HydroToolInterface, LayerSelectionMixin):
         
     def create_gui(self, parent_widget: QWidget) -> QWidget:
         """Create GUI by wrapping the existing dialog"""
-        from qgis.PyQt.QtWidgets import QVBoxLayout, QPushButton, QLabel
-        
-        widget = QWidget(parent_widget)
-        layout = QVBoxLayout(widget)
-        
-        # Description
-        desc = QLabel(
-            "<h2>Rational Method C Calculator</h2>"
-            "<p>This tool calculates area-weighted composite runoff coefficients "
-            "for rational method analysis.</p>"
-            "<p><b>Features:</b></p>"
-            "<ul>"
-            "<li>Slope-based C value determination</li>"
-            "<li>Project-wide slope category selection</li>"
-            "<li>Handles unrecognized soil groups</li>"
-            "<li>Professional reporting formats</li>"
-            "</ul>"
+        self.gui_widget = _build_launcher_widget(
+            parent_widget, self._DESCRIPTION_HTML, "Open C Value Calculator",
+            self._LAUNCH_BUTTON_QSS, self.launch_original_dialog
         )
-        desc.setWordWrap(True)
-        layout.addWidget(desc)
-        
-        # Launch button
-        launch_btn = QPushButton("Open C Value Calculator")
-        launch_btn.setStyleSheet("""
-            QPushButton {
-                font-size: 16px;
-                font-weight: bold;
-                padding: 15px;
-                background-color: #28a745;
-                color: white;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #218838;
-            }
-        """)
-        launch_btn.clicked.connect(self.launch_original_dialog)
-        layout.addWidget(launch_btn)
-        
-        layout.addStretch()
-        
-        self.gui_widget = widget
-        return widget
+        return self.gui_widget
     
     def launch_original_dialog(self):
         """Launch the original C calculator dialog"""
-        try:
-            from qgis.PyQt.QtWidgets import QMessageBox
-            QMessageBox.information(
-                self.gui_widget,
-                "C Value Calculator",
-                "In production, this would launch the actual Rational C Calculator dialog.\n\n"
-                "The tool would be imported from:\n"
-                "Components/Rational_C/composite_C_calculator.py"
-            )
-        except Exception as e:
-            from qgis.PyQt.QtWidgets import QMessageBox
-            QMessageBox.critical(self.gui_widget, "Error", f"Failed to launch C Calculator: {str(e)}")
+        _launch_placeholder_dialog(
+            self.gui_widget,
+            "C Value Calculator",
+            "In production, this would launch the actual Rational C Calculator dialog.\n\n"
+            "The tool would be imported from:\n"
+            "Components/Rational_C/composite_C_calculator.py",
+            "C Calculator"
+        )
     
     def validate_inputs(self) -> Tuple[bool, str]:
         """Validation is handled by the original dialog"""
@@ -4,34 +4,261 @@ Unified hydrological analysis toolbox for QGIS 3.40+
 Version 1.0 - 2025
 """
 
-import os
-import sys
 import importlib
-import json
 from pathlib import Path
+from types import MappingProxyType
 from typing import Dict, Optional, Any
 
 from qgis.PyQt.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QListWidget, QListWidgetItem, QStackedWidget,
     QLabel, QPushButton, QProgressBar, QMessageBox,
-    QFrame, QSplitter, QTextEdit, QToolBar, QAction,
-    QMenuBar, QMenu, QStatusBar
+    QFrame, QSplitter, QTextEdit, QToolBar, QAction, QStatusBar
 )
-from qgis.PyQt.QtCore import Qt, QSettings, pyqtSignal, QThread
-from qgis.PyQt.QtGui import QIcon, QFont, QPixmap
-from qgis.core import QgsProject, QgsMessageLog, Qgis
-from qgis.gui import QgsGui
+from qgis.PyQt.QtCore import Qt, QSettings
+from qgis.PyQt.QtGui import QFont
+from qgis.core import QgsMessageLog, Qgis
 
 # Import the tool interface base class
 from hydro_suite_interface import HydroToolInterface
 
 
+# Registered tools; read-only so every controller can share the same table
+_TOOL_CONFIGS = MappingProxyType({
+    "cn_calculator": MappingProxyType({
+        "name": "Curve Number Calculator",
+        "module": "CN.composite_cn_calculator",
+        "class": "CompositeCNTool",
+        "icon": "cn_icon.png",
+        "category": "Runoff Analysis",
+        "description": "Calculate area-weighted composite curve numbers for hydrological modeling"
+    }),
+    "c_calculator": MappingProxyType({
+        "name": "Rational C Calculator",
+        "module": "Rational_C.composite_C_calculator",
+        "class": "RationalCTool",
+        "icon": "c_icon.png",
+        "category": "Runoff Analysis",
+        "description": "Calculate composite runoff coefficients for rational method analysis"
+    }),
+    "tc_calculator": MappingProxyType({
+        "name": "Time of Concentration",
+        "module": "TC_Multi_Method_Single_Basin.tc_wrapper",
+        "class": "TimeOfConcentrationTool",
+        "icon": "tc_icon.png",
+        "category": "Watershed Analysis",
+        "description": "Calculate time of concentration using multiple methods"
+    }),
+    "channel_designer": MappingProxyType({
+        "name": "Channel Designer",
+        "module": "channel_designer_tool",
+        "class": "ChannelDesignerTool",
+        "icon": "channel_icon.png",
+        "category": "Hydraulic Design",
+        "description": "Design trapezoidal channel cross-sections with SWMM integration"
+    })
+})
+
+# Framework implementations of the registered tools: tool_id -> (module, class)
+_WRAPPER_REGISTRY = {
+    "cn_calculator": ("cn_calculator_tool", "CNCalculatorTool"),
+    "c_calculator": ("rational_c_tool", "RationalCTool"),
+    "tc_calculator": ("tc_calculator_tool", "TCCalculatorTool"),
+    "channel_designer": ("channel_designer_tool", "ChannelDesignerTool"),
+}
+
+# Tool classes already resolved from _WRAPPER_REGISTRY
+_CLASS_CACHE: Dict[str, type] = {}
+
+# QGIS message-log severity for each log level
+_QGIS_LEVELS = {
+    "info": Qgis.Info,
+    "warning": Qgis.Warning,
+    "error": Qgis.Critical,
+    "critical": Qgis.Critical,
+    "success": Qgis.Success,
+}
+
+# Opening tag and label for each log level shown in the log panel
+_LOG_LEVEL_HTML = {
+    level: f'<span style="color: {color}">[{level.upper()}] '
+    for level, color in (
+        ("info", "#000000"),
+        ("warning", "#ff9800"),
+        ("error", "#f44336"),
+        ("success", "#4caf50"),
+    )
+}
+
+# Dialog text; the tool info template is filled from a tool's config
+_TOOL_INFO_TEMPLATE = """
+<h3>{name}</h3>
+<p><b>Category:</b> {category}</p>
+<p><b>Description:</b> {description}</p>
+<p><b>Module:</b> {module}</p>
+"""
+
+_ABOUT_HTML = """
+<h2>Hydro Suite</h2>
+<p>Version 1.0 - 2025</p>
+<p>A comprehensive QGIS toolbox for hydrological and stormwater analysis.</p>
+<p><b>Features:</b></p>
+<ul>
+<li>Curve Number Calculator</li>
+<li>Rational Method C Calculator</li>
+<li>Time of Concentration (Multi-Method)</li>
+<li>Trapezoidal Channel Designer</li>
+</ul>
+<p><b>Developed for:</b> QGIS 3.40+</p>
+"""
+
+# Widget stylesheets
+_MOCK_STATUS_STYLE = """
+    QLabel {
+        border: 2px dashed #ff9800;
+        padding: 20px;
+        background-color: #fff3e0;
+        border-radius: 8px;
+        color: #f57c00;
+        font-weight: bold;
+    }
+"""
+
+_MOCK_PLACEHOLDER_STYLE = """
+    QLabel {
+        padding: 20px;
+        color: #666;
+        font-style: italic;
+    }
+"""
+
+_PANEL_TITLE_STYLE = """
+    QLabel {
+        font-size: 16px;
+        font-weight: bold;
+        padding: 10px;
+        background-color: #2c3e50;
+        color: white;
+        border-radius: 4px;
+    }
+"""
+
+_TOOL_LIST_STYLE = """
+    QListWidget {
+        font-size: 14px;
+        border: none;
+        background-color: #f8f9fa;
+    }
+    QListWidget::item {
+        padding: 12px;
+        border-bottom: 1px solid #dee2e6;
+    }
+    QListWidget::item:selected {
+        background-color: #007bff;
+        color: white;
+    }
+    QListWidget::item:hover {
+        background-color: #e9ecef;
+    }
+"""
+
+_LOG_HEADER_STYLE = """
+    QLabel {
+        font-weight: bold;
+        padding: 5px;
+        background-color: #f8f9fa;
+        border-bottom: 1px solid #dee2e6;
+    }
+"""
+
+_LOG_TEXT_STYLE = """
+    QTextEdit {
+        font-family: Consolas, Monaco, monospace;
+        font-size: 12px;
+        background-color: #f8f9fa;
+        border: none;
+    }
+"""
+
+_WELCOME_TITLE_STYLE = """
+    QLabel {
+        font-size: 24px;
+        font-weight: bold;
+        color: #2c3e50;
+        margin: 20px;
+    }
+"""
+
+_WELCOME_DESC_STYLE = """
+    QLabel {
+        font-size: 14px;
+        color: #555;
+        margin: 20px;
+    }
+"""
+
+
+class _MockTool(HydroToolInterface):
+    """Placeholder for registered tools that have no framework implementation yet"""
+    
+    def __init__(self, tool_id: str, config: Dict[str, Any]):
+        super().__init__()
+        self.name = config["name"]
+        self.description = config["description"]
+        self.category = config["category"]
+        self.icon = config.get("icon", "default_icon.png")
+        self.tool_id = tool_id
+        self.module = config["module"]
+    
+    def create_gui(self, parent_widget):
+        """Create mock GUI"""
+        widget = QWidget(parent_widget)
+        layout = QVBoxLayout(widget)
+        
+        # Title
+        title = QLabel(f"<h2>{self.name}</h2>")
+        layout.addWidget(title)
+        
+        # Description
+        desc = QLabel(self.description)
+        desc.setWordWrap(True)
+        layout.addWidget(desc)
+        
+        # Implementation status
+        status_label = QLabel("🚧 This tool is being migrated to the new framework")
+        status_label.setAlignment(Qt.AlignCenter)
+        status_label.setStyleSheet(_MOCK_STATUS_STYLE)
+        layout.addWidget(status_label)
+        
+        # Placeholder for future implementation
+        placeholder = QLabel(f"Full {self.name} interface coming soon...")
+        placeholder.setAlignment(Qt.AlignCenter)
+        placeholder.setStyleSheet(_MOCK_PLACEHOLDER_STYLE)
+        layout.addWidget(placeholder)
+        
+        layout.addStretch()
+        return widget
+    
+    def validate_inputs(self):
+        return True, "Mock tool - validation not implemented"
+    
+    def run(self, progress_callback):
+        QMessageBox.information(
+            None, 
+            "Tool Under Development",
+            f"The {self.name} tool is being integrated into the new framework.\n\n"
+            f"For now, please use the original standalone version:\n"
+            f"Module: {self.module}\n\n"
+            f"This tool will be fully integrated soon!"
+        )
+
+
 class HydroSuiteController:
     """Main controller for the Hydro Suite toolbox"""
     
     def __init__(self):
         self.tools_registry = {}
+        self._categories_cache: Optional[Dict[str, list]] = None
         self.settings = QSettings("HydroSuite", "MainController")
         self.components_path = Path(__file__).parent / "Components"
         self.resources_path = Path(__file__).parent / "Resources"
@@ -44,44 +271,8 @@ class HydroSuiteController:
     
     def discover_tools(self):
         """Discover and register available tools"""
-        # Define tool configurations
-        tool_configs = {
-            "cn_calculator": {
-                "name": "Curve Number Calculator",
-                "module": "CN.composite_cn_calculator",
-                "class": "CompositeCNTool",
-                "icon": "cn_icon.png",
-                "category": "Runoff Analysis",
-                "description": "Calculate area-weighted composite curve numbers for hydrological modeling"
-            },
-            "c_calculator": {
-                "name": "Rational C Calculator",
-                "module": "Rational_C.composite_C_calculator",
-                "class": "RationalCTool",
-                "icon": "c_icon.png",
-                "category": "Runoff Analysis",
-                "description": "Calculate composite runoff coefficients for rational method analysis"
-            },
-            "tc_calculator": {
-                "name": "Time of Concentration",
-                "module": "TC_Multi_Method_Single_Basin.tc_wrapper",
-                "class": "TimeOfConcentrationTool",
-                "icon": "tc_icon.png",
-                "category": "Watershed Analysis",
-                "description": "Calculate time of concentration using multiple methods"
-            },
-            "channel_designer": {
-                "name": "Channel Designer",
-                "module": "channel_designer_tool",
-                "class": "ChannelDesignerTool",
-                "icon": "channel_icon.png",
-                "category": "Hydraulic Design",
-                "description": "Design trapezoidal channel cross-sections with SWMM integration"
-            }
-        }
-        
         # Register each tool
-        for tool_id, config in tool_configs.items():
+        for tool_id, config in _TOOL_CONFIGS.items():
             self.register_tool(tool_id, config)
             
         QgsMessageLog.logMessage(
@@ -98,6 +289,7 @@ class HydroSuiteController:
             "instance": None,  # Lazy loading
             "loaded": False
         }
+        self._categories_cache = None
     
     def load_tool(self, tool_id: str) -> Optional[HydroToolInterface]:
         """Load a tool instance (lazy loading)"""
@@ -147,97 +339,41 @@ class HydroSuiteController:
         """Create a wrapper for existing tools"""
         
         # Import actual tools
-        if tool_id == "cn_calculator":
-            from cn_calculator_tool import CNCalculatorTool
-            return CNCalculatorTool()
-        elif tool_id == "c_calculator":
-            from rational_c_tool import RationalCTool
-            return RationalCTool()
-        elif tool_id == "tc_calculator":
-            from tc_calculator_tool import TCCalculatorTool
-            return TCCalculatorTool()
-        elif tool_id == "channel_designer":
-            from channel_designer_tool import ChannelDesignerTool
-            return ChannelDesignerTool()
+        entry = _WRAPPER_REGISTRY.get(tool_id)
+        if entry:
+            tool_class = _CLASS_CACHE.get(tool_id)
+            if tool_class is None:
+                module_name, class_name = entry
+                tool_class = getattr(importlib.import_module(module_name), class_name)
+                _CLASS_CACHE[tool_id] = tool_class
+            return tool_class()
         
         # For other tools, return mock until implemented
-        class MockTool(HydroToolInterface):
-            def __init__(self):
-                super().__init__()
-                self.name = config["name"]
-                self.description = config["description"]
-                self.category = config["category"]
-                self.icon = config.get("icon", "default_icon.png")
-                self.tool_id = tool_id
-            
-            def create_gui(self, parent_widget):
-                """Create mock GUI"""
-                widget = QWidget(parent_widget)
-                layout = QVBoxLayout(widget)
-                
-                # Title
-                title = QLabel(f"<h2>{self.name}</h2>")
-                layout.addWidget(title)
-                
-                # Description
-                desc = QLabel(self.description)
-                desc.setWordWrap(True)
-                layout.addWidget(desc)
-                
-                # Implementation status
-                status_label = QLabel("🚧 This tool is being migrated to the new framework")
-                status_label.setAlignment(Qt.AlignCenter)
-                status_label.setStyleSheet("""
-                    QLabel {
-                        border: 2px dashed #ff9800;
-                        padding: 20px;
-                        background-color: #fff3e0;
-                        border-radius: 8px;
-                        color: #f57c00;
-                        font-weight: bold;
-                    }
-                """)
-                layout.addWidget(status_label)
-                
-                # Placeholder for future implementation
-                placeholder = QLabel(f"Full {self.name} interface coming soon...")
-                placeholder.setAlignment(Qt.AlignCenter)
-                placeholder.setStyleSheet("""
-                    QLabel {
-                        padding: 20px;
-                        color: #666;
-                        font-style: italic;
-                    }
-                """)
-                layout.addWidget(placeholder)
-                
-                layout.addStretch()
-                return widget
-            
-            def validate_inputs(self):
-                return True, "Mock tool - validation not implemented"
-            
-            def run(self, progress_callback):
-                QMessageBox.information(
-                    None, 
-                    "Tool Under Development",
-                    f"The {self.name} tool is being integrated into the new framework.\n\n"
-                    f"For now, please use the original standalone version:\n"
-                    f"Module: {config['module']}\n\n"
-                    f"This tool will be fully integrated soon!"
-                )
-        
-        return MockTool()
+        return _MockTool(tool_id, config)
     
     def get_tool_categories(self) -> Dict[str, list]:
-        """Get tools organized by category"""
-        categories = {}
-        for tool_id, tool_info in self.tools_registry.items():
-            category = tool_info["config"]["category"]
-            if category not in categories:
-                categories[category] = []
-            categories[category].append(tool_id)
-        return categories
+        """
+        Get tools organized by category
+        
+        The result is cached until a tool is registered and shared between
+        callers; copy it before modifying.
+        """
+        if self._categories_cache is None:
+            categories = {}
+            for tool_id, tool_info in self.tools_registry.items():
+                category = tool_info["config"]["category"]
+                if category not in categories:
+                    categories[category] = []
+                categories[category].append(tool_id)
+            self._categories_cache = categories
+        return self._categories_cache
+    
+    def iter_tools_by_category(self):
+        """Yield (category, tool_id, name) for every tool, grouped by category"""
+        registry = self.tools_registry
+        for category, tool_ids in self.get_tool_categories().items():
+            for tool_id in tool_ids:
+                yield category, tool_id, registry[tool_id]["config"]["name"]
 
 
 class HydroSuiteMainWindow(QMainWindow):
@@ -247,6 +383,7 @@ class HydroSuiteMainWindow(QMainWindow):
         super().__init__(parent)
         self.controller = HydroSuiteController()
         self.current_tool = None
+        self._tool_widgets: Dict[str, QWidget] = {}  # tool_id -> page in tool_stack
         
         self.setWindowTitle("Hydro Suite - Hydrological Analysis Tools")
         self.setMinimumSize(1000, 700)
@@ -299,54 +436,34 @@ class HydroSuiteMainWindow(QMainWindow):
         
         # Title
         title = QLabel("Available Tools")
-        title.setStyleSheet("""
-            QLabel {
-                font-size: 16px;
-                font-weight: bold;
-                padding: 10px;
-                background-color: #2c3e50;
-                color: white;
-                border-radius: 4px;
-            }
-        """)
+        title.setStyleSheet(_PANEL_TITLE_STYLE)
         layout.addWidget(title)
         
         # Tool list
         self.tool_list = QListWidget()
-        self.tool_list.setStyleSheet("""
-            QListWidget {
-                font-size: 14px;
-                border: none;
-                background-color: #f8f9fa;
-            }
-            QListWidget::item {
-                padding: 12px;
-                border-bottom: 1px solid #dee2e6;
-            }
-            QListWidget::item:selected {
-                background-color: #007bff;
-                color: white;
-            }
-            QListWidget::item:hover {
-                background-color: #e9ecef;
-            }
-        """)
-        
-        # Populate tool list by category
-        categories = self.controller.get_tool_categories()
-        for category, tool_ids in categories.items():
-            # Add category header
-            category_item = QListWidgetItem(f"━━ {category} ━━")
-            category_item.setFlags(Qt.NoItemFlags)
-            category_item.setFont(QFont("Arial", 10, QFont.Bold))
-            self.tool_list.addItem(category_item)
-            
-            # Add tools in category
-            for tool_id in tool_ids:
-                tool_info = self.controller.tools_registry[tool_id]
-                tool_item = QListWidgetItem(f"  ▸ {tool_info['config']['name']}")
+        self.tool_list.setStyleSheet(_TOOL_LIST_STYLE)
+        
+        # Populate tool list by category; repaint once when done. The
+        # selection signal is connected afterwards, so no slot runs per item.
+        header_font = QFont("Arial", 10, QFont.Bold)
+        current_category = None
+        self.tool_list.setUpdatesEnabled(False)
+        try:
+            for category, tool_id, name in self.controller.iter_tools_by_category():
+                # Add category header
+                if category != current_category:
+                    category_item = QListWidgetItem(f"━━ {category} ━━")
+                    category_item.setFlags(Qt.NoItemFlags)
+                    category_item.setFont(header_font)
+                    self.tool_list.addItem(category_item)
+                    current_category = category
+                
+                # Add tool in category
+                tool_item = QListWidgetItem(f"  ▸ {name}")
                 tool_item.setData(Qt.UserRole, tool_id)
                 self.tool_list.addItem(tool_item)
+        finally:
+            self.tool_list.setUpdatesEnabled(True)
         
         # Connect selection change
         self.tool_list.currentItemChanged.connect(self.on_tool_selected)
@@ -391,27 +508,13 @@ class HydroSuiteMainWindow(QMainWindow):
         
         # Log header
         log_header = QLabel("Processing Log")
-        log_header.setStyleSheet("""
-            QLabel {
-                font-weight: bold;
-                padding: 5px;
-                background-color: #f8f9fa;
-                border-bottom: 1px solid #dee2e6;
-            }
-        """)
+        log_header.setStyleSheet(_LOG_HEADER_STYLE)
         log_layout.addWidget(log_header)
         
         # Log text area
         self.log_text = QTextEdit()
         self.log_text.setReadOnly(True)
-        self.log_text.setStyleSheet("""
-            QTextEdit {
-                font-family: Consolas, Monaco, monospace;
-                font-size: 12px;
-                background-color: #f8f9fa;
-                border: none;
-            }
-        """)
+        self.log_text.setStyleSheet(_LOG_TEXT_STYLE)
         log_layout.addWidget(self.log_text)
         
         v_splitter.addWidget(log_frame)
@@ -440,14 +543,7 @@ class HydroSuiteMainWindow(QMainWindow):
         
         # Title
         title = QLabel("Welcome to Hydro Suite")
-        title.setStyleSheet("""
-            QLabel {
-                font-size: 24px;
-                font-weight: bold;
-                color: #2c3e50;
-                margin: 20px;
-            }
-        """)
+        title.setStyleSheet(_WELCOME_TITLE_STYLE)
         title.setAlignment(Qt.AlignCenter)
         layout.addWidget(title)
         
@@ -456,13 +552,7 @@ class HydroSuiteMainWindow(QMainWindow):
             "A comprehensive QGIS toolbox for hydrological and stormwater analysis.\n\n"
             "Select a tool from the left panel to begin."
         )
-        desc.setStyleSheet("""
-            QLabel {
-                font-size: 14px;
-                color: #555;
-                margin: 20px;
-            }
-        """)
+        desc.setStyleSheet(_WELCOME_DESC_STYLE)
         desc.setAlignment(Qt.AlignCenter)
         desc.setWordWrap(True)
         layout.addWidget(desc)
@@ -501,15 +591,15 @@ class HydroSuiteMainWindow(QMainWindow):
         tools_menu = menubar.addMenu("&Tools")
         
         # Add tools by category
-        categories = self.controller.get_tool_categories()
-        for category, tool_ids in categories.items():
-            category_menu = tools_menu.addMenu(category)
-            for tool_id in tool_ids:
-                tool_info = self.controller.tools_registry[tool_id]
-                action = QAction(tool_info['config']['name'], self)
-                action.setData(tool_id)
-                action.triggered.connect(lambda checked, tid=tool_id: self.select_tool(tid))
-                category_menu.addAction(action)
+        current_category = None
+        for category, tool_id, name in self.controller.iter_tools_by_category():
+            if category != current_category:
+                category_menu = tools_menu.addMenu(category)
+                current_category = category
+            action = QAction(name, self)
+            action.setData(tool_id)
+            action.triggered.connect(self._on_menu_tool_triggered)
+            category_menu.addAction(action)
         
         # Help menu
         help_menu = menubar.addMenu("&Help")
@@ -553,6 +643,12 @@ class HydroSuiteMainWindow(QMainWindow):
         self.setStatusBar(self.status_bar)
         self.status_bar.showMessage("Ready")
     
+    def _on_menu_tool_triggered(self, checked: bool = False):
+        """Open the tool whose id is stored on the triggering menu action"""
+        tool_id = self.sender().data()
+        if tool_id:
+            self.select_tool(tool_id)
+    
     def on_tool_selected(self, current, previous):
         """Handle tool selection change"""
         if not current:
@@ -576,17 +672,14 @@ class HydroSuiteMainWindow(QMainWindow):
             return
         
         # Create tool GUI if not already in stack
-        if tool_id not in [self.tool_stack.widget(i).property("tool_id") 
-                          for i in range(self.tool_stack.count())]:
+        tool_widget = self._tool_widgets.get(tool_id)
+        if tool_widget is None:
             tool_widget = tool.create_gui(self.tool_stack)
-            tool_widget.setProperty("tool_id", tool_id)
             self.tool_stack.addWidget(tool_widget)
+            self._tool_widgets[tool_id] = tool_widget
         
         # Switch to tool widget
-        for i in range(self.tool_stack.count()):
-            if self.tool_stack.widget(i).property("tool_id") == tool_id:
-                self.tool_stack.setCurrentIndex(i)
-                break
+        self.tool_stack.setCurrentWidget(tool_widget)
         
         self.current_tool = tool
         self.status_bar.showMessage(f"Loaded: {tool.name}")
@@ -637,50 +730,23 @@ class HydroSuiteMainWindow(QMainWindow):
             return
         
         tool_info = self.controller.tools_registry[tool_id]
-        config = tool_info['config']
-        
-        info_text = f"""
-<h3>{config['name']}</h3>
-<p><b>Category:</b> {config['category']}</p>
-<p><b>Description:</b> {config['description']}</p>
-<p><b>Module:</b> {config['module']}</p>
-"""
+        info_text = _TOOL_INFO_TEMPLATE.format_map(tool_info['config'])
         
         QMessageBox.information(self, "Tool Information", info_text)
     
     def show_about(self):
         """Show about dialog"""
-        about_text = """
-<h2>Hydro Suite</h2>
-<p>Version 1.0 - 2025</p>
-<p>A comprehensive QGIS toolbox for hydrological and stormwater analysis.</p>
-<p><b>Features:</b></p>
-<ul>
-<li>Curve Number Calculator</li>
-<li>Rational Method C Calculator</li>
-<li>Time of Concentration (Multi-Method)</li>
-<li>Trapezoidal Channel Designer</li>
-</ul>
-<p><b>Developed for:</b> QGIS 3.40+</p>
-"""
-        QMessageBox.about(self, "About Hydro Suite", about_text)
+        QMessageBox.about(self, "About Hydro Suite", _ABOUT_HTML)
     
     def log(self, message: str, level: str = "info"):
         """Add message to log"""
-        timestamp = QgsMessageLog.logMessage(message, "HydroSuite", 
-                                            getattr(Qgis, level.capitalize(), Qgis.Info))
-        
-        # Color code by level
-        colors = {
-            "info": "#000000",
-            "warning": "#ff9800",
-            "error": "#f44336",
-            "success": "#4caf50"
-        }
-        color = colors.get(level, "#000000")
+        QgsMessageLog.logMessage(message, "HydroSuite", _QGIS_LEVELS.get(level, Qgis.Info))
         
-        # Add to log widget
-        self.log_text.append(f'<span style="color: {color}">[{level.upper()}] {message}</span>')
+        # Add to log widget, color coded by level
+        prefix = _LOG_LEVEL_HTML.get(level)
+        if prefix is None:
+            prefix = f'<span style="color: #000000">[{level.upper()}] '
+        self.log_text.append(f'{prefix}{message}</span>')
     
     def load_settings(self):
         """Load saved settings"""
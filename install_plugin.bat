@@ -61,6 +61,17 @@ if errorlevel 1 (
     exit /b 1
 )
 
+:: Byte-compile the installed sources so QGIS can skip compiling them on first load.
+:: Set QGIS_PYTHON to the interpreter bundled with QGIS; cached files built by a
+:: different Python version are simply ignored.
+if not defined QGIS_PYTHON set QGIS_PYTHON=python
+echo Byte-compiling plugin files...
+"%QGIS_PYTHON%" -m compileall -q "%TARGET_DIR%" >nul 2>&1
+if errorlevel 1 (
+    echo NOTE: Could not byte-compile plugin files with "%QGIS_PYTHON%".
+    echo QGIS will compile them on first load instead.
+)
+
 echo.
 echo ✅ SUCCESS: Hydro Suite plugin installed!
 echo.
@@ -20,9 +20,8 @@ from qgis.PyQt.QtCore import Qt, pyqtSignal
 from qgis.core import (
     QgsCoordinateReferenceSystem, QgsProcessingFeedback, QgsProject,
     QgsVectorFileWriter, QgsVectorLayer, QgsField, QgsFeature,
-    QgsWkbTypes, Qgis, QgsMessageLog
+    QgsWkbTypes, Qgis, QgsMessageLog, QgsFeatureRequest
 )
-from qgis import processing
 
 # Import our shared components
 from hydro_suite_interface import HydroToolInterface, LayerSelectionMixin
@@ -46,6 +45,7 @@ class RationalCTool(HydroToolInterface, LayerSelectionMixin):
         # Tool-specific properties
         self.target_crs = QgsCoordinateReferenceSystem("EPSG:3361")
         self.lookup_data = {}
+        self.lookup_source = None  # Key of the table currently in lookup_data
         self.selected_slope = "0-2%"  # Default slope category
         
         # GUI components
@@ -312,6 +312,13 @@ class RationalCTool(HydroToolInterface, LayerSelectionMixin):
         if not lookup_file:
             raise ValueError("No lookup file selected")
             
+        # Skip re-reading a table that has not changed since the last load
+        source_key = None
+        if os.path.exists(lookup_file):
+            source_key = (lookup_file, os.path.getmtime(lookup_file), self.selected_slope)
+        if self.lookup_data and source_key is not None and source_key == self.lookup_source:
+            return
+            
         # Import pandas for reading the lookup table
         try:
             import pandas as pd
@@ -372,6 +379,7 @@ class RationalCTool(HydroToolInterface, LayerSelectionMixin):
         if not self.lookup_data:
             raise ValueError(f"No valid C values found for slope category '{self.selected_slope}'")
             
+        self.lookup_source = source_key
         self.progress_logger.log(
             f"Loaded {len(self.lookup_data)} C value entries for slope '{self.selected_slope}' from {Path(lookup_file).name}"
         )
@@ -440,6 +448,11 @@ class RationalCTool(HydroToolInterface, LayerSelectionMixin):
             
             progress_callback(10, f"Using slope category: {self.selected_slope}")
             
+            # Stop before any reprojection or overlay work if an input is empty
+            for layer in (catchment_layer, landuse_layer, soils_layer):
+                if layer.featureCount() == 0:
+                    raise ValueError(f"Layer {layer.name()} has no features")
+                    
             # Create feedback object for QGIS processing
             feedback = QgsProcessingFeedback()
             
@@ -488,6 +501,8 @@ class RationalCTool(HydroToolInterface, LayerSelectionMixin):
         if layer.crs() == self.target_crs:
             return layer
             
+        from qgis import processing
+        
         self.progress_logger.log(f"Reprojecting {layer.name()} from {layer.crs().authid()} to {self.target_crs.authid()}")
         
         params = {
@@ -500,6 +515,8 @@ class RationalCTool(HydroToolInterface, LayerSelectionMixin):
         
     def intersect_layers(self, layer1: QgsVectorLayer, layer2: QgsVectorLayer, feedback) -> QgsVectorLayer:
         """Perform intersection between two layers"""
+        from qgis import processing
+        
         self.progress_logger.log(f"Intersecting {layer1.name()} with {layer2.name()}")
         
         params = {
@@ -523,14 +540,31 @@ class RationalCTool(HydroToolInterface, LayerSelectionMixin):
         catchment_data = {}
         detailed_records = []
         
-        for feature in intersection_layer.getFeatures():
+        # Resolve attribute indices once for the whole loop
+        catchment_idx = self.get_field_index(intersection_layer, catchment_field)
+        landuse_idx = self.get_field_index(intersection_layer, landuse_field)
+        soils_idx = self.get_field_index(intersection_layer, soils_field)
+        
+        # Only the three keyed attributes (plus geometry) are needed
+        request = QgsFeatureRequest().setSubsetOfAttributes(
+            [catchment_idx, landuse_idx, soils_idx]
+        )
+        
+        # Parse each distinct soil value once and report each missing
+        # lookup once, rather than logging for every intersected feature
+        parsed_soil_groups = {}
+        reported = set()
+        
+        for feature in intersection_layer.getFeatures(request):
             # Get attributes
-            catchment_id = feature[catchment_field]
-            landuse_code = str(feature[landuse_field]).strip().lower()
-            soil_group_raw = str(feature[soils_field]).strip()
+            catchment_id = feature[catchment_idx]
+            landuse_code = str(feature[landuse_idx]).strip().lower()
+            soil_group_raw = str(feature[soils_idx]).strip()
             
             # Parse soil group (handle split HSGs)
-            soil_group = self.parse_soil_group(soil_group_raw)
+            if soil_group_raw not in parsed_soil_groups:
+                parsed_soil_groups[soil_group_raw] = self.parse_soil_group(soil_group_raw)
+            soil_group = parsed_soil_groups[soil_group_raw]
             
             # Calculate area in acres
             area_sqft = feature.geometry().area()
@@ -540,14 +574,18 @@ class RationalCTool(HydroToolInterface, LayerSelectionMixin):
             if soil_group is None:
                 # For unrecognized soil groups (e.g., Water), use default C=0.95
                 c_value = 0.95
-                self.progress_logger.log(f"Using default C=0.95 for unrecognized soil group: {soil_group_raw}")
+                if soil_group_raw not in reported:
+                    reported.add(soil_group_raw)
+                    self.progress_logger.log(f"Using default C=0.95 for unrecognized soil group: {soil_group_raw}")
             else:
                 c_key = (landuse_code, soil_group)
                 if c_key not in self.lookup_data:
-                    self.progress_logger.log(
-                        f"Warning: No C value found for land use '{landuse_code}' and soil group '{soil_group}'", 
-                        "warning"
-                    )
+                    if c_key not in reported:
+                        reported.add(c_key)
+                        self.progress_logger.log(
+                            f"Warning: No C value found for land use '{landuse_code}' and soil group '{soil_group}'", 
+                            "warning"
+                        )
                     continue
                 c_value = self.lookup_data[c_key]
             
@@ -622,9 +660,10 @@ class RationalCTool(HydroToolInterface, LayerSelectionMixin):
         # Add features with calculated C values
         output_features = []
         catchment_data = results['catchment_data']
+        catchment_idx = self.get_field_index(catchment_layer, catchment_field)
         
         for orig_feature in catchment_layer.getFeatures():
-            catchment_id = orig_feature[catchment_field]
+            catchment_id = orig_feature[catchment_idx]
             
             new_feature = QgsFeature()
             new_feature.setGeometry(orig_feature.geometry())
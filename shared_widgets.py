@@ -13,7 +13,7 @@ from qgis.PyQt.QtWidgets import (
     QPushButton, QRadioButton, QButtonGroup, QFrame, QGroupBox,
     QFileDialog, QMessageBox, QProgressBar, QTextEdit
 )
-from qgis.PyQt.QtCore import Qt, pyqtSignal
+from qgis.PyQt.QtCore import Qt, QTimer, pyqtSignal
 from qgis.PyQt.QtGui import QFont
 
 from qgis.core import QgsProject, QgsVectorLayer, QgsWkbTypes
@@ -124,21 +124,27 @@ class LayerFieldSelector(QWidget):
         
     def update_layer_list(self):
         """Update the list of available layers"""
-        self.combo_layers.clear()
-        self.combo_layers.addItem("-- Select a layer --", None)
-        
-        # Get layers from project
-        layers = self.get_project_layers()
-        
-        if not layers:
-            self.combo_layers.addItem("No suitable layers found", None)
-            self.radio_project.setEnabled(False)
-            if self.radio_project.isChecked():
-                self.radio_file.setChecked(True)
-        else:
-            self.radio_project.setEnabled(True)
-            for layer in layers:
-                self.combo_layers.addItem(layer.name(), layer)
+        # Rebuild silently so on_layer_changed runs once, not per clear/add
+        self.combo_layers.blockSignals(True)
+        try:
+            self.combo_layers.clear()
+            self.combo_layers.addItem("-- Select a layer --", None)
+            
+            # Get layers from project
+            layers = self.get_project_layers()
+            
+            if not layers:
+                self.combo_layers.addItem("No suitable layers found", None)
+                self.radio_project.setEnabled(False)
+                if self.radio_project.isChecked():
+                    self.radio_file.setChecked(True)
+            else:
+                self.radio_project.setEnabled(True)
+                for layer in layers:
+                    self.combo_layers.addItem(layer.name(), layer)
+        finally:
+            self.combo_layers.blockSignals(False)
+        self.on_layer_changed()
         
         self.lbl_status.setText(f"Found {len(layers)} layers")
         
@@ -202,28 +208,34 @@ class LayerFieldSelector(QWidget):
         
     def populate_fields(self):
         """Populate the field dropdown"""
-        self.combo_fields.clear()
-        
-        if not self.selected_layer or not self.selected_layer.isValid():
-            self.combo_fields.addItem("No layer selected", None)
-            return
-            
-        # Get field names
-        field_names = [field.name() for field in self.selected_layer.fields()]
-        
-        if not field_names:
-            self.combo_fields.addItem("No fields found", None)
-            return
-            
-        # Add fields to combo
-        for field_name in field_names:
-            self.combo_fields.addItem(field_name, field_name)
+        # Fill silently and report the final field once; set_layer validates
+        self.combo_fields.blockSignals(True)
+        try:
+            self.combo_fields.clear()
             
-        # Select default field if it exists
-        if self.default_field and self.default_field in field_names:
-            self.combo_fields.setCurrentText(self.default_field)
+            if not self.selected_layer or not self.selected_layer.isValid():
+                self.combo_fields.addItem("No layer selected", None)
+                return
+                
+            # Get field names
+            field_names = [field.name() for field in self.selected_layer.fields()]
             
-        self.lbl_status.setText(f"Layer: {self.selected_layer.name()} ({len(field_names)} fields)")
+            if not field_names:
+                self.combo_fields.addItem("No fields found", None)
+                return
+                
+            # Add fields to combo
+            for field_name in field_names:
+                self.combo_fields.addItem(field_name, field_name)
+                
+            # Select default field if it exists
+            if self.default_field and self.default_field in field_names:
+                self.combo_fields.setCurrentText(self.default_field)
+                
+            self.lbl_status.setText(f"Layer: {self.selected_layer.name()} ({len(field_names)} fields)")
+        finally:
+            self.combo_fields.blockSignals(False)
+            self.field_changed.emit(self.get_selected_field() or "")
         
     def on_field_changed(self):
         """Handle field selection change"""
@@ -417,8 +429,20 @@ class DirectorySelector(QWidget):
 class ProgressLogger(QWidget):
     """Widget for showing progress and logging"""
     
+    # Log lines are queued and flushed together so bursts of messages
+    # trigger one repaint instead of one per line
+    FLUSH_INTERVAL_MS = 50
+    # Oldest lines are dropped past this so long runs do not grow the log forever
+    MAX_LOG_LINES = 5000
+    
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._pending_lines = []
+        self._last_logged_message = ""  # Message of the most recent log() line
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self.flush_log)
         self.setup_ui()
         
     def setup_ui(self):
@@ -438,6 +462,7 @@ class ProgressLogger(QWidget):
         self.log_text = QTextEdit()
         self.log_text.setMaximumHeight(150)
         self.log_text.setReadOnly(True)
+        self.log_text.document().setMaximumBlockCount(self.MAX_LOG_LINES)
         self.log_text.setStyleSheet("""
             QTextEdit {
                 font-family: Consolas, Monaco, monospace;
@@ -461,8 +486,11 @@ class ProgressLogger(QWidget):
         
     def update_progress(self, value: int, message: str = ""):
         """Update progress bar and log message"""
-        self.progress_bar.setValue(value)
-        if message:
+        if value != self.progress_bar.value():
+            self.progress_bar.setValue(value)
+        # Status text that repeats the line just logged adds nothing; a run
+        # starting at 0 always logs its first message
+        if message and (value == 0 or message != self._last_logged_message):
             self.log(message)
             
     def log(self, message: str, level: str = "info"):
@@ -479,10 +507,24 @@ class ProgressLogger(QWidget):
         }
         color = colors.get(level, "#000000")
         
-        # Add to log
-        self.log_text.append(
+        # Queue for the next flush
+        self._last_logged_message = message
+        self._pending_lines.append(
             f'<span style="color: {color}">[{timestamp}] {message}</span>'
         )
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+            
+    def flush_log(self):
+        """Write queued log lines to the log view"""
+        if not self._pending_lines:
+            return
+        lines, self._pending_lines = self._pending_lines, []
+        
+        self.log_text.setUpdatesEnabled(False)
+        for line in lines:
+            self.log_text.append(line)
+        self.log_text.setUpdatesEnabled(True)
         
         # Auto-scroll to bottom
         scrollbar = self.log_text.verticalScrollBar()
@@ -490,6 +532,9 @@ class ProgressLogger(QWidget):
         
     def clear_log(self):
         """Clear the log"""
+        self._flush_timer.stop()
+        self._pending_lines = []
+        self._last_logged_message = ""
         self.log_text.clear()
 
 
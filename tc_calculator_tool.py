@@ -22,9 +22,9 @@ from qgis.PyQt.QtCore import Qt, pyqtSignal
 from qgis.core import (
     QgsCoordinateReferenceSystem, QgsProcessingFeedback, QgsProject,
     QgsVectorFileWriter, QgsVectorLayer, QgsField, QgsFeature,
-    QgsWkbTypes, Qgis, QgsMessageLog, QgsPointXY, QgsGeometry
+    QgsWkbTypes, Qgis, QgsMessageLog, QgsPointXY, QgsGeometry,
+    QgsFeatureRequest
 )
-from qgis import processing
 
 # Import our shared components
 from hydro_suite_interface import HydroToolInterface, LayerSelectionMixin
@@ -593,6 +593,10 @@ class TCCalculatorTool(HydroToolInterface, LayerSelectionMixin):
             dem_layer = self.dem_selector.get_selected_layer()
             output_dir = self.output_selector.get_selected_directory()
             
+            # Stop before any geometry work if there is nothing to process
+            if subbasin_layer.featureCount() == 0:
+                raise ValueError(f"Layer {subbasin_layer.name()} has no features")
+                
             progress_callback(10, f"Using methods: {', '.join(self.selected_methods)}")
             
             # Calculate TC for each subbasin
@@ -631,9 +635,21 @@ class TCCalculatorTool(HydroToolInterface, LayerSelectionMixin):
         """Calculate TC for each subbasin using selected methods"""
         results = {}
         total_features = subbasin_layer.featureCount()
+        last_progress = -1
+        subbasin_idx = self.get_field_index(subbasin_layer, subbasin_field)
+        
+        # Only the ID attribute (plus geometry) is needed
+        request = QgsFeatureRequest().setSubsetOfAttributes([subbasin_idx])
+        
+        # Parameters and methods do not change during a run; read the UI once
+        method_params = self.get_current_parameters()
+        active_methods = [
+            (method_id, self.methods[method_id], method_params.get(method_id, {}))
+            for method_id in self.selected_methods
+        ]
         
-        for i, feature in enumerate(subbasin_layer.getFeatures()):
-            subbasin_id = feature[subbasin_field]
+        for i, feature in enumerate(subbasin_layer.getFeatures(request)):
+            subbasin_id = feature[subbasin_idx]
             geometry = feature.geometry()
             
             # Calculate length and slope for this subbasin
@@ -643,12 +659,8 @@ class TCCalculatorTool(HydroToolInterface, LayerSelectionMixin):
             
             # Calculate TC using each selected method
             tc_results = {}
-            method_params = self.get_current_parameters()
             
-            for method_id in self.selected_methods:
-                method = self.methods[method_id]
-                params = method_params.get(method_id, {})
-                
+            for method_id, method, params in active_methods:
                 tc_minutes = method.calculate(length_ft, slope_percent, **params)
                 tc_results[method_id] = {
                     'tc_minutes': tc_minutes,
@@ -662,9 +674,11 @@ class TCCalculatorTool(HydroToolInterface, LayerSelectionMixin):
                 'tc_results': tc_results
             }
             
-            # Update progress
-            progress = 20 + int((i + 1) / total_features * 60)
-            progress_callback(progress, f"Processed {i + 1}/{total_features} subbasins")
+            # Update progress only when the percentage moves
+            progress = 20 + (i + 1) * 60 // total_features
+            if progress != last_progress:
+                last_progress = progress
+                progress_callback(progress, f"Processed {i + 1}/{total_features} subbasins")
             
         return results
         
@@ -719,38 +733,46 @@ class TCCalculatorTool(HydroToolInterface, LayerSelectionMixin):
             method_name = self.methods[method_id].name
             columns.append(f'{method_name} (min)')
             
-        self.results_table.setRowCount(subbasin_count)
-        self.results_table.setColumnCount(len(columns))
-        self.results_table.setHorizontalHeaderLabels(columns)
+        table = self.results_table
         
-        # Populate data
-        all_tc_values = []
-        
-        for row, (subbasin_id, data) in enumerate(results.items()):
-            # Basic data
-            self.results_table.setItem(row, 0, QTableWidgetItem(str(subbasin_id)))
-            self.results_table.setItem(row, 1, QTableWidgetItem(f"{data['length_ft']:.0f}"))
-            self.results_table.setItem(row, 2, QTableWidgetItem(f"{data['slope_percent']:.2f}"))
-            
-            # TC values for this subbasin
-            tc_values = [result['tc_minutes'] for result in data['tc_results'].values()]
-            all_tc_values.extend(tc_values)
-            
-            if tc_values:
-                self.results_table.setItem(row, 3, QTableWidgetItem(f"{min(tc_values):.1f}"))
-                self.results_table.setItem(row, 4, QTableWidgetItem(f"{max(tc_values):.1f}"))
-                self.results_table.setItem(row, 5, QTableWidgetItem(f"{sum(tc_values)/len(tc_values):.1f}"))
-            
-            # Individual method results
-            col = 6
-            for method_id in self.selected_methods:
-                if method_id in data['tc_results']:
-                    tc_min = data['tc_results'][method_id]['tc_minutes']
-                    self.results_table.setItem(row, col, QTableWidgetItem(f"{tc_min:.1f}"))
-                col += 1
+        # Populate with repaints suspended so Qt lays the table out once
+        table.setUpdatesEnabled(False)
+        try:
+            table.clearContents()
+            table.setRowCount(subbasin_count)
+            table.setColumnCount(len(columns))
+            table.setHorizontalHeaderLabels(columns)
+            
+            # Populate data
+            all_tc_values = []
+            set_item = table.setItem
+            
+            for row, (subbasin_id, data) in enumerate(results.items()):
+                # Basic data
+                set_item(row, 0, QTableWidgetItem(str(subbasin_id)))
+                set_item(row, 1, QTableWidgetItem(f"{data['length_ft']:.0f}"))
+                set_item(row, 2, QTableWidgetItem(f"{data['slope_percent']:.2f}"))
+                
+                # TC values for this subbasin
+                tc_results = data['tc_results']
+                tc_values = [result['tc_minutes'] for result in tc_results.values()]
+                all_tc_values.extend(tc_values)
+                
+                if tc_values:
+                    set_item(row, 3, QTableWidgetItem(f"{min(tc_values):.1f}"))
+                    set_item(row, 4, QTableWidgetItem(f"{max(tc_values):.1f}"))
+                    set_item(row, 5, QTableWidgetItem(f"{sum(tc_values)/len(tc_values):.1f}"))
                 
-        # Resize columns
-        self.results_table.resizeColumnsToContents()
+                # Individual method results
+                for col, method_id in enumerate(self.selected_methods, start=6):
+                    if method_id in tc_results:
+                        tc_min = tc_results[method_id]['tc_minutes']
+                        set_item(row, col, QTableWidgetItem(f"{tc_min:.1f}"))
+                        
+            # Resize columns
+            table.resizeColumnsToContents()
+        finally:
+            table.setUpdatesEnabled(True)
         
         # Update summary
         if all_tc_values:
@@ -798,9 +820,10 @@ class TCCalculatorTool(HydroToolInterface, LayerSelectionMixin):
         
         # Add features with TC values
         output_features = []
+        subbasin_idx = self.get_field_index(subbasin_layer, subbasin_field)
         
         for orig_feature in subbasin_layer.getFeatures():
-            subbasin_id = orig_feature[subbasin_field]
+            subbasin_id = orig_feature[subbasin_idx]
             
             new_feature = QgsFeature()
             new_feature.setGeometry(orig_feature.geometry())
@@ -859,43 +882,45 @@ class TCCalculatorTool(HydroToolInterface, LayerSelectionMixin):
         """Save detailed TC calculation results to CSV"""
         csv_path = os.path.join(output_dir, "tc_calculations_detailed.csv")
         
-        with open(csv_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
+        # Header
+        header = ['Subbasin_ID', 'Length_ft', 'Slope_percent']
+        for method_id in self.selected_methods:
+            method_name = self.methods[method_id].name
+            header.extend([f'{method_name}_minutes', f'{method_name}_hours'])
+        header.extend(['Min_TC_minutes', 'Max_TC_minutes', 'Avg_TC_minutes'])
+        
+        # Build all data rows first, then write them in a single call
+        rows = []
+        for subbasin_id, data in results.items():
+            tc_results = data['tc_results']
+            row = [subbasin_id, round(data['length_ft'], 2), round(data['slope_percent'], 3)]
             
-            # Header
-            header = ['Subbasin_ID', 'Length_ft', 'Slope_percent']
+            tc_values = []
             for method_id in self.selected_methods:
-                method_name = self.methods[method_id].name
-                header.extend([f'{method_name}_minutes', f'{method_name}_hours'])
-            header.extend(['Min_TC_minutes', 'Max_TC_minutes', 'Avg_TC_minutes'])
-            
-            writer.writerow(header)
-            
-            # Data rows
-            for subbasin_id, data in results.items():
-                row = [subbasin_id, round(data['length_ft'], 2), round(data['slope_percent'], 3)]
-                
-                tc_values = []
-                for method_id in self.selected_methods:
-                    if method_id in data['tc_results']:
-                        tc_min = data['tc_results'][method_id]['tc_minutes']
-                        tc_hr = data['tc_results'][method_id]['tc_hours']
-                        row.extend([round(tc_min, 2), round(tc_hr, 3)])
-                        tc_values.append(tc_min)
-                    else:
-                        row.extend([None, None])
-                        
-                # Summary stats
-                if tc_values:
-                    row.extend([
-                        round(min(tc_values), 2),
-                        round(max(tc_values), 2), 
-                        round(sum(tc_values)/len(tc_values), 2)
-                    ])
+                if method_id in tc_results:
+                    tc_min = tc_results[method_id]['tc_minutes']
+                    tc_hr = tc_results[method_id]['tc_hours']
+                    row.extend([round(tc_min, 2), round(tc_hr, 3)])
+                    tc_values.append(tc_min)
                 else:
-                    row.extend([None, None, None])
+                    row.extend([None, None])
                     
-                writer.writerow(row)
+            # Summary stats
+            if tc_values:
+                row.extend([
+                    round(min(tc_values), 2),
+                    round(max(tc_values), 2), 
+                    round(sum(tc_values)/len(tc_values), 2)
+                ])
+            else:
+                row.extend([None, None, None])
+                
+            rows.append(row)
+            
+        with open(csv_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(header)
+            writer.writerows(rows)
                 
     def show_completion_dialog(self, results: dict, output_dir: str):
         """Show completion dialog with results summary"""
@@ -3,92 +3,104 @@ Complete Framework Test for Hydro Suite
 Run this script in QGIS Python Console to test all tools including Channel Designer
 """
 
+import io
 import sys
 import os
+import importlib.util
 from pathlib import Path
 
 def test_complete_framework():
     """Test the complete Hydro Suite framework including Channel Designer"""
     
+    # Collect the report and write it to the console once at the end
+    buf = io.StringIO()
+    
+    def emit(*args):
+        print(*args, file=buf)
+    
     # Set up path
     script_dir = Path(r'E:\CLAUDE_Workspace\Claude\Report_Files\Codebase\Hydro_Suite\Hydro_Suite_Data')
-    if str(script_dir) not in sys.path:
-        sys.path.insert(0, str(script_dir))
+    script_path = str(script_dir)
+    if script_path not in sys.path:
+        sys.path.insert(0, script_path)
     
-    # Change to script directory
+    # Change to script directory unless a previous run left us there
     original_cwd = os.getcwd()
-    os.chdir(str(script_dir))
+    if original_cwd != script_path:
+        os.chdir(script_path)
     
-    print("🧪 Testing Complete Hydro Suite Framework")
-    print("=" * 50)
+    emit("🧪 Testing Complete Hydro Suite Framework")
+    emit("=" * 50)
     
     try:
         # Test all imports
-        print("📦 Testing core imports...")
+        emit("📦 Testing core imports...")
         
         from hydro_suite_interface import HydroToolInterface, LayerSelectionMixin
-        print("✅ Core interfaces imported")
+        emit("✅ Core interfaces imported")
         
         from shared_widgets import LayerFieldSelector, ValidationPanel, ProgressLogger
-        print("✅ Shared widgets imported")
+        emit("✅ Shared widgets imported")
         
         from cn_calculator_tool import CNCalculatorTool
-        print("✅ CN Calculator imported")
+        emit("✅ CN Calculator imported")
         
         from rational_c_tool import RationalCTool
-        print("✅ Rational C Calculator imported")
+        emit("✅ Rational C Calculator imported")
         
         from tc_calculator_tool import TCCalculatorTool
-        print("✅ TC Calculator imported")
+        emit("✅ TC Calculator imported")
         
         from channel_designer_tool import ChannelDesignerTool, ChannelGeometry
-        print("✅ Channel Designer imported")
+        emit("✅ Channel Designer imported")
         
         from hydro_suite_main import HydroSuiteMainWindow, HydroSuiteController
-        print("✅ Main framework imported")
+        emit("✅ Main framework imported")
         
         # Test controller functionality
-        print("\n🎛️ Testing framework controller...")
+        emit("\n🎛️ Testing framework controller...")
         controller = HydroSuiteController()
         
         tools_registry = controller.tools_registry
-        print(f"✅ Found {len(tools_registry)} registered tools:")
+        emit(f"✅ Found {len(tools_registry)} registered tools:")
         
-        for tool_id, tool_info in tools_registry.items():
-            config = tool_info['config']
-            print(f"   • {config['name']} ({config['category']})")
+        if tools_registry:
+            emit("\n".join(
+                f"   • {info['config']['name']} ({info['config']['category']})"
+                for info in tools_registry.values()
+            ))
         
         # Test tool loading
-        print("\n🔧 Testing tool loading...")
+        emit("\n🔧 Testing tool loading...")
         
         # Test CN Calculator
         cn_tool = controller.load_tool("cn_calculator")
         if cn_tool:
-            print(f"✅ CN Calculator loaded: {cn_tool.name}")
+            emit(f"✅ CN Calculator loaded: {cn_tool.name}")
         else:
-            print("❌ CN Calculator failed to load")
+            emit("❌ CN Calculator failed to load")
         
         # Test Rational C Calculator
         c_tool = controller.load_tool("c_calculator")
         if c_tool:
-            print(f"✅ Rational C Calculator loaded: {c_tool.name}")
+            emit(f"✅ Rational C Calculator loaded: {c_tool.name}")
         else:
-            print("❌ Rational C Calculator failed to load")
+            emit("❌ Rational C Calculator failed to load")
         
         # Test TC Calculator
         tc_tool = controller.load_tool("tc_calculator")
         if tc_tool:
-            print(f"✅ TC Calculator loaded: {tc_tool.name}")
+            emit(f"✅ TC Calculator loaded: {tc_tool.name}")
         else:
-            print("❌ TC Calculator failed to load")
+            emit("❌ TC Calculator failed to load")
         
         # Test Channel Designer
         channel_tool = controller.load_tool("channel_designer")
         if channel_tool:
-            print(f"✅ Channel Designer loaded: {channel_tool.name}")
+            emit(f"✅ Channel Designer loaded: {channel_tool.name}")
             
             # Test Channel Designer functionality
-            print("  🔍 Testing Channel Designer features...")
+            emit("  🔍 Testing Channel Designer features...")
             
             # Test geometry calculations
             geometry = ChannelGeometry(2.0, 4.0, 3.0, 3.0, 100.0)
@@ -96,73 +108,114 @@ def test_complete_framework():
             props = geometry.calculate_properties()
             swmm_format = geometry.get_swmm_format()
             
-            print(f"     • Generated {len(points)} channel points")
-            print(f"     • Top width: {props['top_width']:.2f} ft")
-            print(f"     • Area: {props['area']:.2f} sq ft")
-            print(f"     • SWMM format generated: {len(swmm_format.split())} coordinate pairs")
+            emit(f"     • Generated {len(points)} channel points")
+            emit(f"     • Top width: {props['top_width']:.2f} ft")
+            emit(f"     • Area: {props['area']:.2f} sq ft")
+            emit(f"     • SWMM format generated: {len(swmm_format.split())} coordinate pairs")
             
             # Test tool validation
             valid, message = channel_tool.validate_inputs()
-            print(f"     • Tool validation: {valid} - {message}")
+            emit(f"     • Tool validation: {valid} - {message}")
             
         else:
-            print("❌ Channel Designer failed to load")
+            emit("❌ Channel Designer failed to load")
+        
+        # Test progress helper with and without a callback
+        emit("\n📊 Testing progress reporting...")
+        progress_tool = cn_tool or c_tool or tc_tool or channel_tool
+        if progress_tool:
+            received = []
+            progress_tool.update_progress(5, "Callback check", lambda v, m: received.append((v, m)))
+            progress_tool.update_progress(10, "No callback", None)
+            if received == [(5, "Callback check")] and progress_tool.current_progress == 10:
+                emit("✅ update_progress works with a callback and with None")
+            else:
+                emit(f"❌ update_progress reported {received}, progress {progress_tool.current_progress}")
+        else:
+            emit("❌ No tool loaded to test progress reporting")
         
         # Test QGIS integration
-        print("\n🗺️ Testing QGIS integration...")
-        from qgis.core import QgsProject, QgsVectorLayer
-        
-        project = QgsProject.instance()
-        layers = project.mapLayers()
-        vector_layers = [layer for layer in layers.values() if isinstance(layer, QgsVectorLayer)]
-        polygon_layers = [layer for layer in vector_layers if layer.geometryType() == 2]
-        
-        print(f"✅ QGIS Project Status:")
-        print(f"   • Total layers: {len(layers)}")
-        print(f"   • Vector layers: {len(vector_layers)}")
-        print(f"   • Polygon layers: {len(polygon_layers)}")
-        
-        if polygon_layers:
-            print(f"   • Sample polygon layers:")
-            for i, layer in enumerate(polygon_layers[:3]):
-                fields = [f.name() for f in layer.fields()]
-                print(f"     - {layer.name()} ({len(fields)} fields)")
+        emit("\n🗺️ Testing QGIS integration...")
+        qgis_available = importlib.util.find_spec("qgis") is not None
+        if not qgis_available:
+            emit("⚠️  QGIS not available, skipping integration test")
+        else:
+            # Kept separate so a QGIS failure doesn't hide the tool results
+            try:
+                from qgis.core import QgsProject, QgsVectorLayer
+                
+                project = QgsProject.instance()
+                layers = project.mapLayers()
+                
+                # Classify layers in one pass, keeping the first three polygon layers
+                vector_count = polygon_count = 0
+                polygon_sample = []
+                for layer in layers.values():
+                    if not isinstance(layer, QgsVectorLayer):
+                        continue
+                    vector_count += 1
+                    if layer.geometryType() == 2:
+                        polygon_count += 1
+                        if len(polygon_sample) < 3:
+                            polygon_sample.append(layer)
+                
+                emit(f"✅ QGIS Project Status:")
+                emit(f"   • Total layers: {len(layers)}")
+                emit(f"   • Vector layers: {vector_count}")
+                emit(f"   • Polygon layers: {polygon_count}")
+                
+                if polygon_sample:
+                    emit(f"   • Sample polygon layers:")
+                    emit("\n".join(
+                        f"     - {layer.name()} ({layer.fields().count()} fields)"
+                        for layer in polygon_sample
+                    ))
+            except ImportError as e:
+                qgis_available = False
+                emit(f"⚠️  QGIS integration test skipped: {e}")
         
         # Test categories
-        print("\n📂 Testing tool categorization...")
+        emit("\n📂 Testing tool categorization...")
         categories = controller.get_tool_categories()
+        category_lines = []
         for category, tool_ids in categories.items():
-            print(f"✅ {category}: {len(tool_ids)} tools")
-            for tool_id in tool_ids:
-                tool_name = controller.tools_registry[tool_id]['config']['name']
-                print(f"   • {tool_name}")
-        
-        print(f"\n🎉 Complete Framework Test Passed!")
-        print(f"\n📋 Framework Summary:")
-        print(f"   • {len(tools_registry)} tools registered and working")
-        print(f"   • {len(categories)} tool categories")
-        print(f"   • All imports successful")
-        print(f"   • QGIS integration functional")
-        print(f"   • Channel Designer fully integrated")
-        
-        print(f"\n🚀 Ready to launch!")
-        print(f"   Use: exec(open(r'{script_dir}/fixed_launch.py').read())")
+            category_lines.append(f"✅ {category}: {len(tool_ids)} tools")
+            category_lines.extend(
+                f"   • {tools_registry[tool_id]['config']['name']}" for tool_id in tool_ids
+            )
+        if category_lines:
+            emit("\n".join(category_lines))
+        
+        emit(f"\n🎉 Complete Framework Test Passed!")
+        emit(f"\n📋 Framework Summary:")
+        emit(f"   • {len(tools_registry)} tools registered and working")
+        emit(f"   • {len(categories)} tool categories")
+        emit(f"   • All imports successful")
+        if qgis_available:
+            emit(f"   • QGIS integration functional")
+        emit(f"   • Channel Designer fully integrated")
+        
+        emit(f"\n🚀 Ready to launch!")
+        emit(f"   Use: exec(open(r'{script_dir}/fixed_launch.py').read())")
         
         return True
         
     except Exception as e:
-        print(f"❌ Framework test failed: {e}")
+        emit(f"❌ Framework test failed: {e}")
         import traceback
-        print(f"Traceback: {traceback.format_exc()}")
+        buf.write("Traceback: ")
+        traceback.print_exc(file=buf)
         return False
         
     finally:
         # Restore directory
-        os.chdir(original_cwd)
+        if original_cwd != script_path:
+            os.chdir(original_cwd)
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
 
-# Run test
-if __name__ == "__main__":
-    test_complete_framework()
-else:
-    # When imported in QGIS, just run the test
+# Run test when executed as a script or from the QGIS Python console
+# (the console's interpreter namespace is named "__console__"); importing
+# the module only defines test_complete_framework()
+if __name__ in ("__main__", "__console__"):
     test_complete_framework()
\ No newline at end of file